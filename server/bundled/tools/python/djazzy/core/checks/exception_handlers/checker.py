@@ -1,6 +1,8 @@
 import ast
 
 from djazzy.core.checks.base import BaseCheckService
+from djazzy.core.lib.ast_cache import parse_source
+from djazzy.core.lib.ast_walk import walk_statements
 from djazzy.core.lib.log import LOGGER
 from djazzy.core.lib.rules import RuleCode
 from .constants import ExceptionHandlingIssue
@@ -47,14 +49,11 @@ class ExceptionHandlingCheckService(BaseCheckService):
     def _parse_source_code(self):
         """Parse the source code into an AST, catching syntax errors gracefully."""
         try:
-            self.tree = ast.parse(self.source_code)
+            self.tree = parse_source(self.source_code)
         except SyntaxError as e:
             LOGGER.error(f"Syntax error while parsing source code: {e}")
             self.tree = None
 
     def _check_for_exception_handling(self, node):
         """Check if exception handling is present in the given node."""
-        for current_node in ast.walk(node):
-            if isinstance(current_node, ast.Try):
-                return True
-        return False
\ No newline at end of file
+        return any(type(current_node) is ast.Try for current_node in walk_statements(node))
\ No newline at end of file
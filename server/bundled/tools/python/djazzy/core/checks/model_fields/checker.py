@@ -1,5 +1,5 @@
 import ast
-from typing import Optional
+from typing import List, Optional, Set
 from enum import Enum
 
 from djazzy.core.lib.rules import RuleCode
@@ -14,6 +14,8 @@ class ModelFieldNames:
     CHARFIELD = 'CharField'
     TEXTFIELD = 'TextField'
 
+CHAR_OR_TEXT_FIELDS = frozenset({ModelFieldNames.CHARFIELD, ModelFieldNames.TEXTFIELD})
+
 class ModelFieldIssueDescription(Enum):
     MISSING_RELATED_NAME = "ForeignKey '{field_name}' is missing 'related_name'. It is recommended to always define 'related_name' for better reverse access."
     MISSING_ON_DELETE = "ForeignKey '{field_name}' is missing 'on_delete'. It is strongly recommended to always define 'on_delete' for better data integrity."
@@ -37,67 +39,47 @@ class ModelFieldCheckService(BaseCheckService):
         super().__init__()
         self.source_code = source_code
 
-    def run_model_field_checks(self, node) -> Optional[ModelFieldIssue]:
+    def run_model_field_checks(self, node) -> List[ModelFieldIssue]:
         """
         Orchestrates the model field checks and returns a list of detected issues.
+        The field call and its keywords are inspected once for all of the checks.
         """
         if not self.is_rule_enabled(RuleCode.CDQ05.value):
             return []
 
-        issues = []
-        
-        related_name_issue = self.check_foreign_key_related_name(node)
-        if related_name_issue:
-            issues.append(related_name_issue)
-
-        on_delete_issue = self.check_foreign_key_on_delete(node)
-        if on_delete_issue:
-            issues.append(on_delete_issue)
+        value = node.value
+        if not isinstance(value, ast.Call) or not isinstance(value.func, ast.Attribute):
+            return []
 
-        nullable_issue = self.check_charfield_and_textfield_is_nullable(node)
-        if nullable_issue:
-            issues.append(nullable_issue)
+        field_type = value.func.attr
+        if field_type == ModelFieldNames.FOREIGN_KEY:
+            return self.check_foreign_key_keywords(node, {keyword.arg for keyword in value.keywords})
 
-        return issues
+        if field_type in CHAR_OR_TEXT_FIELDS:
+            nullable_issue = self.check_charfield_and_textfield_is_nullable(node)
+            if nullable_issue:
+                return [nullable_issue]
 
-    def check_foreign_key_related_name(self, node) -> Optional[ModelFieldIssue]:
-        if isinstance(node.value, ast.Call) and isinstance(node.value.func, ast.Attribute):
-            if node.value.func.attr == ModelFieldNames.FOREIGN_KEY:
-                for keyword in node.value.keywords:
-                    if keyword.arg == ModelFieldNames.RELATED_NAME:
-                        return None
-                return ModelFieldIssue(
-                    lineno=node.lineno,
-                    col=node.col_offset,
-                    description=ModelFieldIssueDescription.MISSING_RELATED_NAME.value.format(field_name=node.targets[0].id),
-                    severity=IssueSeverity.WARNING
-                )
-        return None
+        return []
 
-    def check_foreign_key_on_delete(self, node) -> Optional[ModelFieldIssue]:
-        if isinstance(node.value, ast.Call) and isinstance(node.value.func, ast.Attribute):
-            if node.value.func.attr == ModelFieldNames.FOREIGN_KEY:
-                for keyword in node.value.keywords:
-                    if keyword.arg == ModelFieldNames.ON_DELETE:
-                        return None
-                return ModelFieldIssue(
-                    lineno=node.lineno,
-                    col=node.col_offset,
-                    description=ModelFieldIssueDescription.MISSING_ON_DELETE.value.format(field_name=node.targets[0].id),
-                    severity=IssueSeverity.WARNING
-                )
-        return None
+    def check_foreign_key_keywords(self, node, keyword_names: Set[Optional[str]]) -> List[ModelFieldIssue]:
+        issues = []
+        if ModelFieldNames.RELATED_NAME not in keyword_names:
+            issues.append(self.create_issue(node, ModelFieldIssueDescription.MISSING_RELATED_NAME, IssueSeverity.WARNING))
+        if ModelFieldNames.ON_DELETE not in keyword_names:
+            issues.append(self.create_issue(node, ModelFieldIssueDescription.MISSING_ON_DELETE, IssueSeverity.WARNING))
+        return issues
 
     def check_charfield_and_textfield_is_nullable(self, node) -> Optional[ModelFieldIssue]:
-        if isinstance(node.value, ast.Call) and isinstance(node.value.func, ast.Attribute):
-            if node.value.func.attr in [ModelFieldNames.CHARFIELD, ModelFieldNames.TEXTFIELD]:
-                for keyword in node.value.keywords:
-                    if keyword.arg == ModelFieldNames.NULL and isinstance(keyword.value, ast.Constant) and keyword.value.value is True:
-                        return ModelFieldIssue(
-                            lineno=node.lineno,
-                            col=node.col_offset,
-                            description=ModelFieldIssueDescription.NULLABLE_CHAR_OR_TEXT_FIELD.value.format(field_name=node.targets[0].id),
-                            severity=IssueSeverity.INFORMATION
-                        )
-                return None
+        for keyword in node.value.keywords:
+            if keyword.arg == ModelFieldNames.NULL and isinstance(keyword.value, ast.Constant) and keyword.value.value is True:
+                return self.create_issue(node, ModelFieldIssueDescription.NULLABLE_CHAR_OR_TEXT_FIELD, IssueSeverity.INFORMATION)
         return None
+
+    def create_issue(self, node, description: ModelFieldIssueDescription, severity) -> ModelFieldIssue:
+        return ModelFieldIssue(
+            lineno=node.lineno,
+            col=node.col_offset,
+            description=description.value.format(field_name=node.targets[0].id),
+            severity=severity
+        )
@@ -3,6 +3,7 @@ import ast
 from djazzy.core.checks.base import BaseCheckService
 from djazzy.core.lib.log import LOGGER
 from djazzy.core.lib.rules import RuleCode
+from djazzy.core.lib.source_index import get_source_index
 from .constants import RedundantQueryMethodIssue
 
 
@@ -10,7 +11,7 @@ class RedundantQueryMethodCheckService(BaseCheckService):
     def __init__(self, source_code: str):
         super().__init__()
         self.source_code = source_code
-        self.lines = self.source_code.splitlines()
+        self.source_index = get_source_index(source_code)
 
     def run_check(self, node: ast.AST) -> RedundantQueryMethodIssue:
         """Run the redundant query method check on the given AST node."""
@@ -24,7 +25,7 @@ class RedundantQueryMethodCheckService(BaseCheckService):
                 if isinstance(current_node, ast.Call):
                     method_chain = self._get_method_chain(current_node)
                     if self._is_redundant_queryset_chain(method_chain):
-                        original_query = self.lines[current_node.lineno - 1]
+                        original_query = self.source_index.lines[current_node.lineno - 1]
                         simplified_chain = self._get_simplified_chain(method_chain)
                         fixed_queryset = self._get_fixed_queryset(original_query, method_chain, simplified_chain)
 
@@ -60,10 +61,7 @@ class RedundantQueryMethodCheckService(BaseCheckService):
 
     def _get_end_col_offset(self, node):
         """Get the end column offset of the method chain."""
-        if hasattr(node, 'end_col_offset'):
-            return node.end_col_offset
-        source_line = self.source_code.splitlines()[node.lineno - 1]
-        return node.col_offset + len(source_line) - node.col_offset
+        return node.end_col_offset
 
     def _get_fixed_queryset(self, original_query, method_chain, simplified_chain):
         """
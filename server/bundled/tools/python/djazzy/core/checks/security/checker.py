@@ -1,9 +1,11 @@
 import ast
-import re
 
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List, Optional, Set
 
+from djazzy.core.lib.ast_cache import parse_source
+from djazzy.core.lib.ast_walk import walk_statements
 from djazzy.core.lib.log import LOGGER
+from djazzy.core.lib.source_index import get_source_index
 from djazzy.core.lib.constants import (
     ALLOWED_HOSTS,
     CSRF_COOKIE_SECURE,
@@ -26,17 +28,54 @@ from djazzy.core.lib.rules import RuleCode
 from .security_issue import SecurityIssue
 from .security_rules import SecurityRules
 
+# Setting name -> (handler method, rule that must be enabled for the handler to run, if any)
+SETTING_CHECKS = {
+    DEBUG: ('check_debug_setting', RuleCode.SEC01.value),
+    SECRET_KEY: ('check_secret_key', RuleCode.SEC02.value),
+    ALLOWED_HOSTS: ('check_allowed_hosts', None),
+    CSRF_COOKIE_SECURE: ('check_csrf_cookie', RuleCode.SEC05.value),
+    SESSION_COOKIE: ('check_session_cookie', RuleCode.SEC06.value),
+    SECURE_SSL_REDIRECT: ('check_ssl_redirect', RuleCode.SEC07.value),
+    X_FRAME_OPTIONS: ('check_x_frame_options', None),
+}
+HSTS_SETTINGS = frozenset({SECURE_HSTS_SECONDS, SECURE_HSTS_INCLUDE_SUBDOMAINS})
+# Text that has to appear in an ASCII module for any security check to report something
+SECURITY_TRIGGER_SNIPPETS = ('raw', 'cursor', *SETTING_CHECKS, *HSTS_SETTINGS)
+
+# Ways of reading SECRET_KEY from the environment instead of hardcoding it. They are all
+# literal text, so plain substring checks find them without going through the regex engine.
+SECRET_KEY_ENV_VAR_SNIPPETS = (
+    'os.environ[',
+    'os.environ.',
+    'os.getenv(',
+    'config(',
+    'env(',
+    'dotenv.get_key(',
+    'env.str(',
+    'django_environ.Env(',
+)
+
 
 class SecurityCheckService(BaseCheckService):
     def __init__(self, source_code: str):
         super().__init__()
         self.source_code = source_code
+        self.source_index = get_source_index(source_code)
         self.processed_nodes = set()
         self.security_issues: Set[SecurityIssue] = set()
+        self.security_issue_codes: Set[str] = set()
+        self.setting_assignments: Optional[Dict[str, ast.Assign]] = None
+        # Non-ASCII identifiers are NFKC-normalized by the parser, so only ASCII sources can be ruled out by text alone
+        self.has_security_triggers: bool = not self.source_index.is_ascii_source or any(
+            snippet in source_code for snippet in SECURITY_TRIGGER_SNIPPETS
+        )
 
     def run_security_checks(self):
         LOGGER.debug('Running security checks...')
-        tree = ast.parse(self.source_code)
+        if not self.has_security_triggers:
+            LOGGER.debug('Skipping security checks, the module mentions no checked settings or calls.')
+            return
+        tree = parse_source(self.source_code)
         self.visit(tree)
         LOGGER.debug(f'Security checks complete. Found {len(self.security_issues)} issues.')
 
@@ -48,19 +87,30 @@ class SecurityCheckService(BaseCheckService):
         return self._convert_security_issues_to_dict()
 
     def issue_already_exists(self, issue_type: str) -> bool:
-        """Check if an issue already exists based on both code and line number."""
-        return any(i.code == issue_type for i in self.security_issues)
+        """Check if an issue with this code has already been reported."""
+        return issue_type in self.security_issue_codes
+
+    def get_setting_assignments(self) -> Dict[str, ast.Assign]:
+        """
+        Map each assigned name to its first assignment in the module, collected in a single walk
+        the first time a setting is looked up instead of rescanning the tree for every lookup.
+        """
+        if self.setting_assignments is None:
+            self.setting_assignments = {}
+            for node in walk_statements(parse_source(self.source_code)):
+                if isinstance(node, ast.Assign):
+                    for target in node.targets:
+                        if isinstance(target, ast.Name):
+                            self.setting_assignments.setdefault(target.id, node)
+        return self.setting_assignments
 
     def get_setting_value(self, setting_name: str):
         try:
-            tree = ast.parse(self.source_code)
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Assign):
-                    for target in node.targets:
-                        if isinstance(target, ast.Name) and target.id == setting_name:
-                            value = ast.literal_eval(node.value)
-                            line = node.lineno
-                            return value, line
+            node = self.get_setting_assignments().get(setting_name)
+            if node is not None:
+                value = ast.literal_eval(node.value)
+                line = node.lineno
+                return value, line
         except Exception as e:
             LOGGER.error(f"Error parsing setting {setting_name}: {e}")
         return None, None
@@ -95,16 +145,32 @@ class SecurityCheckService(BaseCheckService):
             doc_link=rule.doc_link
         )
         self.security_issues.add(issue)
+        self.security_issue_codes.add(issue.code)
     
     def add_raw_sql_issue(self, node, is_using_cursor=False):
         rule = SecurityRules.RAW_SQL_USAGE_WITH_CURSOR if is_using_cursor else SecurityRules.RAW_SQL_USAGE
         self.add_security_issue(rule, node.lineno, IssueSeverity.INFORMATION)
 
     def visit_Call(self, node):
+        if self.check_call(node):
+            self.generic_visit(node)
+
+    def visit_Assign(self, node):
+        self.check_assign(node)
+        if isinstance(node, ast.Assign):
+            self.generic_visit(node)
+
+    def check_call(self, node) -> bool:
+        """
+        Run the raw SQL checks on a single Call node without descending into its children.
+        Returns False if the node was already processed.
+        """
+        if not self.has_security_triggers:
+            return True
         LOGGER.debug(f'[SECURITY CHECK] Visiting Call node at line {node.lineno}')
         node_id = (node.lineno, node.col_offset)
         if node_id in self.processed_nodes:
-            return
+            return False
 
         self.processed_nodes.add(node_id)
 
@@ -114,10 +180,12 @@ class SecurityCheckService(BaseCheckService):
 
             if self.is_connection_cursor(node.func):
                 self.add_raw_sql_issue(node, is_using_cursor=True)
+        return True
 
-        self.generic_visit(node)
-
-    def visit_Assign(self, node):
+    def check_assign(self, node):
+        """Run the settings checks on a single Assign node without descending into its children."""
+        if not self.has_security_triggers:
+            return
         LOGGER.debug(f'[SECURITY CHECK] Visiting Assign node at line {node.lineno}')
         if isinstance(node, ast.Name):
             self.check_assignment_security(node.id, node.value, node.lineno)
@@ -125,7 +193,6 @@ class SecurityCheckService(BaseCheckService):
             for target in node.targets:
                 if isinstance(target, ast.Name):
                     self.check_assignment_security(target.id, node.value, node.lineno)
-            self.generic_visit(node)
 
     def is_connection_cursor(self, func):
         return (
@@ -136,23 +203,14 @@ class SecurityCheckService(BaseCheckService):
         )
 
     def check_assignment_security(self, name: str, value: ast.expr, line: int):
-        value_str = ast.get_source_segment(self.source_code, value).strip()
-        if name == DEBUG and self.is_rule_enabled(RuleCode.SEC01.value):
-            self.check_debug_setting(value_str, line)
-        elif name == SECRET_KEY and self.is_rule_enabled(RuleCode.SEC02.value):
-            self.check_secret_key(value_str, line)
-        elif name == ALLOWED_HOSTS:
-            self.check_allowed_hosts(value_str, line)
-        elif name == CSRF_COOKIE_SECURE and self.is_rule_enabled(RuleCode.SEC05.value):
-            self.check_csrf_cookie(value_str, line)
-        elif name == SESSION_COOKIE and self.is_rule_enabled(RuleCode.SEC06.value):
-            self.check_session_cookie(value_str, line)
-        elif name == SECURE_SSL_REDIRECT and self.is_rule_enabled(RuleCode.SEC07.value):
-            self.check_ssl_redirect(value_str, line)
-        elif name == X_FRAME_OPTIONS:
-            self.check_x_frame_options(value_str, line)
-
-        if name == SECURE_HSTS_SECONDS or name == SECURE_HSTS_INCLUDE_SUBDOMAINS:
+        # Most assignments are not settings, so the value source is only sliced for the ones that are
+        setting_check = SETTING_CHECKS.get(name)
+        if setting_check:
+            check_method_name, rule_code = setting_check
+            if rule_code is None or self.is_rule_enabled(rule_code):
+                value_str = self.source_index.get_source_segment(value).strip()
+                getattr(self, check_method_name)(value_str, line)
+        elif name in HSTS_SETTINGS:
             hsts_seconds_value, hsts_seconds_line = self.get_setting_value(SECURE_HSTS_SECONDS)
             hsts_subdomains_value, hsts_subdomains_line = self.get_setting_value(SECURE_HSTS_INCLUDE_SUBDOMAINS)
             self.check_hsts_settings(hsts_seconds_value, hsts_seconds_line, hsts_subdomains_value, hsts_subdomains_line)
@@ -162,11 +220,7 @@ class SecurityCheckService(BaseCheckService):
             self.add_security_issue(SecurityRules.DEBUG_TRUE, line)
 
     def check_secret_key(self, value: str, line: int):
-        env_var_patterns = re.compile(
-            r'os\.environ(\[|\.)|os\.getenv\(|config\(|env\(|dotenv\.get_key\(|env\.str\(|django_environ\.Env\('
-        )
-
-        if not env_var_patterns.search(value):
+        if not any(snippet in value for snippet in SECRET_KEY_ENV_VAR_SNIPPETS):
             self.add_security_issue(SecurityRules.HARDCODED_SECRET_KEY, line)
 
     def check_allowed_hosts(self, value: str, line: int):
@@ -223,19 +277,3 @@ class SecurityCheckService(BaseCheckService):
             self.is_rule_enabled(RuleCode.SEC12.value)
         ):
             self.add_security_issue(SecurityRules.SECURE_HSTS_INCLUDE_SUBDOMAINS_FALSE, hsts_subdomains_line)
-
-    def check_raw_sql(self, node: ast.Call):
-        if isinstance(node, ast.Call):
-            node_id = (node.lineno, node.col_offset)
-            if node_id in self.processed_nodes:
-                return
-
-            self.processed_nodes.add(node_id)
-
-            if isinstance(node.func, ast.Attribute):
-                if node.func.attr == "raw" and self.is_rule_enabled(RuleCode.SEC13.value):
-                    self.add_raw_sql_issue(node)
-
-                if self.is_connection_cursor(node.func) and self.is_rule_enabled(RuleCode.SEC14.value):
-                    self.add_raw_sql_issue(node, is_using_cursor=True)
-                
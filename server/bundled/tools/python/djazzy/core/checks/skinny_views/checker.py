@@ -49,14 +49,9 @@ class ViewComplexityAnalyzer(BaseCheckService):
 
     def _get_line_count(self, node):
         """
-        Get the number of lines for a given function or class, handling cases where end_lineno 
-        may be missing or invalid.
+        Get the number of lines for a given function or class.
         """
-        if hasattr(node, 'end_lineno') and hasattr(node, 'lineno'):
-            return node.end_lineno - node.lineno + 1
-        else:
-            # If line numbers are not available, fall back to counting lines from the node source segment
-            return len(ast.get_source_segment(self.source_code, node).splitlines())
+        return node.end_lineno - node.lineno + 1
 
     def _count_operations(self, body):
         """
@@ -69,11 +64,13 @@ class ViewComplexityAnalyzer(BaseCheckService):
                                 ast.Raise, ast.ExceptHandler)):
                 operations += 1
 
-            if hasattr(stmt, 'body'):
-                operations += self._count_operations(stmt.body)
+            nested_body = getattr(stmt, 'body', None)
+            if nested_body:
+                operations += self._count_operations(nested_body)
 
-            if hasattr(stmt, 'orelse') and stmt.orelse:
-                operations += self._count_operations(stmt.orelse)
+            nested_orelse = getattr(stmt, 'orelse', None)
+            if nested_orelse:
+                operations += self._count_operations(nested_orelse)
 
             if isinstance(stmt, ast.Expr) and isinstance(stmt.value, ast.Call):
                 operations += 1
@@ -1,4 +1,5 @@
 import os
+import sys
 import json
 
 from djazzy.core.parsers.django_parser import DjangoAnalyzer
@@ -59,5 +60,6 @@ def check_command(args):
 
     results = {file_path: analyze_file(file_path)}
 
-    print(json.dumps(results, default=str, indent=2))
+    json.dump(results, sys.stdout, default=str, indent=2)
+    sys.stdout.write('\n')
     print(f"\nFound {results[file_path]['diagnostics_count']} issues.")
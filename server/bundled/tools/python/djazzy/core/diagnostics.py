@@ -1,4 +1,18 @@
 class Diagnostic:
+    __slots__ = (
+        'file_path',
+        'line',
+        'col_offset',
+        'end_col_offset',
+        'severity',
+        'message',
+        'issue_code',
+        'full_line_length',
+        'extra_fields',
+    )
+    # Fields every diagnostic reports, which extra_fields must never overwrite in to_dict
+    CORE_FIELD_NAMES = frozenset(__slots__) - {'extra_fields'}
+
     def __init__(
         self,
         file_path,
@@ -9,6 +23,7 @@ class Diagnostic:
         message,
         issue_code,
         full_line_length,
+        extra_fields=None,
     ):
         """
         Diagnostic represents an issue detected in a specific file.
@@ -19,7 +34,15 @@ class Diagnostic:
         :param severity: Severity of the issue (ERROR, WARNING, etc.).
         :param message: Description of the issue.
         :param issue_code: The code corresponding to the rule violated (from the Issue class).
+        :param full_line_length: Length of the line the issue was found on.
+        :param extra_fields: Additional check-specific fields (comments, body, arguments, etc.).
+        :raises ValueError: If extra_fields reuses the name of a core field.
         """
+        extra_fields = {} if extra_fields is None else extra_fields
+        conflicting_fields = self.CORE_FIELD_NAMES.intersection(extra_fields)
+        if conflicting_fields:
+            raise ValueError(f"Extra fields cannot replace core diagnostic fields: {sorted(conflicting_fields)}")
+
         self.file_path = file_path
         self.line = line
         self.col_offset = col_offset
@@ -28,8 +51,18 @@ class Diagnostic:
         self.message = message
         self.issue_code = issue_code
         self.full_line_length = full_line_length
+        self.extra_fields = extra_fields
 
     def to_dict(self):
-        """Convert the Diagnostic object to a dictionary for JSON output, including dynamically added fields."""
-        result = self.__dict__.copy()
-        return result
+        """Convert the Diagnostic object to a dictionary for JSON output, including the extra fields."""
+        return {
+            'file_path': self.file_path,
+            'line': self.line,
+            'col_offset': self.col_offset,
+            'end_col_offset': self.end_col_offset,
+            'severity': self.severity,
+            'message': self.message,
+            'issue_code': self.issue_code,
+            'full_line_length': self.full_line_length,
+            **self.extra_fields,
+        }
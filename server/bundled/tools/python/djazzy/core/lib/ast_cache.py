@@ -0,0 +1,14 @@
+import ast
+from functools import lru_cache
+
+MAX_CACHED_TREES = 8
+
+
+@lru_cache(maxsize=MAX_CACHED_TREES)
+def parse_source(source_code: str) -> ast.Module:
+    """
+    Parse source code into an AST, reusing the tree from an earlier call with identical source.
+    The analyzer and its check services all inspect the same file, so they share a single parse.
+    Callers must treat the returned tree as read-only.
+    """
+    return ast.parse(source_code, type_comments=False)
@@ -0,0 +1,19 @@
+import ast
+from collections import deque
+from typing import Iterator
+
+
+def walk_statements(node: ast.AST) -> Iterator[ast.AST]:
+    """
+    Breadth-first walk like ast.walk, but without descending into expressions.
+    Statements never appear inside expressions, so lookups for imports, classes,
+    assignments or try blocks find the same nodes in the same order.
+    """
+    pending_nodes = deque([node])
+    while pending_nodes:
+        current_node = pending_nodes.popleft()
+        pending_nodes.extend(
+            child for child in ast.iter_child_nodes(current_node)
+            if not isinstance(child, ast.expr)
+        )
+        yield current_node
@@ -1,20 +1,23 @@
-DJANGO_IGNORE_FUNCTIONS = {
-    "save": True,
-    "delete": True,
-    "__str__": True,
-    "clean": True,
-    "get_absolute_url": True,
-    "create": True,
-    "update": True,
-    "validate": True,
-    "get_queryset": True,
-    "get": True,
-    "post": True,
-    "put": True,
-    "get_context_data": True,
-    "validate_<field_name>": True,
-    "perform_create": True,
-}
+DJANGO_IGNORE_FUNCTIONS = frozenset({
+    "save",
+    "delete",
+    "__str__",
+    "clean",
+    "get_absolute_url",
+    "create",
+    "update",
+    "validate",
+    "get_queryset",
+    "get",
+    "post",
+    "put",
+    "get_context_data",
+    "validate_<field_name>",
+    "perform_create",
+})
+
+# Length of `def ():`, i.e. an empty function definition without its name
+EMPTY_FUNCTION_DEFINITION_LENGTH = len('def ():')
 
 DEBUG = 'DEBUG'
 SECRET_KEY = 'SECRET_KEY'
@@ -1,4 +1,5 @@
 
+from djazzy.core.lib.constants import EMPTY_FUNCTION_DEFINITION_LENGTH
 from djazzy.core.lib.log import LOGGER
 from .view_detector import DjangoViewDetectionService, DjangoViewType
 
@@ -6,15 +7,13 @@ class FunctionNodeService:
     @staticmethod
     def get_function_end_position(node, source_code):
         """Determine the end line and column of the function."""
-        end_line = node.body[-1].end_lineno if hasattr(node.body[-1], 'end_lineno') else node.body[-1].lineno
-        end_col = node.body[-1].end_col_offset if hasattr(node.body[-1], 'end_col_offset') else len(source_code.splitlines()[end_line - 1])
-        return end_line, end_col
+        return node.body[-1].end_lineno, node.body[-1].end_col_offset
 
     @staticmethod
     def get_empty_function_position(start_line, start_col, function_name):
         """Calculate end position for empty functions."""
         end_line = start_line
-        end_col = start_col + len(f'def {function_name}():')
+        end_col = start_col + EMPTY_FUNCTION_DEFINITION_LENGTH + len(function_name)
         return end_line, end_col
 
     @staticmethod
@@ -0,0 +1,51 @@
+import ast
+import re
+from functools import lru_cache
+from typing import List, Optional
+
+LINE_BREAK_PATTERN = re.compile(r'\r\n|\r|\n')
+MAX_CACHED_INDEXES = 8
+
+
+class SourceIndex:
+    """Maps AST positions onto offsets into the source text they were parsed from."""
+
+    def __init__(self, source_code: str):
+        self.source_code = source_code
+        self.is_ascii_source: bool = source_code.isascii()
+        self.line_starts: List[int] = [0] + [match.end() for match in LINE_BREAK_PATTERN.finditer(source_code)]
+        self._lines: Optional[List[str]] = None
+
+    @property
+    def lines(self) -> List[str]:
+        """The source split with str.splitlines(), computed on first use and shared by every caller."""
+        if self._lines is None:
+            self._lines = self.source_code.splitlines()
+        return self._lines
+
+    def get_char_offset(self, lineno: int, col_offset: int) -> int:
+        """Convert an AST (lineno, UTF-8 byte col_offset) pair into an index into source_code."""
+        line_start = self.line_starts[lineno - 1]
+        if self.is_ascii_source:
+            return line_start + col_offset
+        line = self.source_code[line_start:line_start + col_offset]
+        return line_start + len(line.encode('utf-8')[:col_offset].decode('utf-8', 'ignore'))
+
+    def get_source_segment(self, node: ast.AST) -> Optional[str]:
+        """
+        Equivalent to ast.get_source_segment(self.source_code, node), but slices the source
+        using the precomputed line offsets instead of re-splitting it on every call.
+        """
+        end_lineno = getattr(node, 'end_lineno', None)
+        end_col_offset = getattr(node, 'end_col_offset', None)
+        if end_lineno is None or end_col_offset is None:
+            return None
+        start = self.get_char_offset(node.lineno, node.col_offset)
+        end = self.get_char_offset(end_lineno, end_col_offset)
+        return self.source_code[start:end]
+
+
+@lru_cache(maxsize=MAX_CACHED_INDEXES)
+def get_source_index(source_code: str) -> SourceIndex:
+    """Return the shared SourceIndex for this source, so the analyzer and checks index it once."""
+    return SourceIndex(source_code)
@@ -1,6 +1,7 @@
 import ast
 from typing import Set, Dict, Optional
 
+from djazzy.core.lib.ast_walk import walk_statements
 from djazzy.core.lib.log import LOGGER
 
 MAX_DEPTH = 5
@@ -38,7 +39,7 @@ class DjangoViewDetectionService:
 
     def _extract_django_imports(self, tree: ast.AST) -> Set[str]:
         imports = set()
-        for node in ast.walk(tree):
+        for node in walk_statements(tree):
             if isinstance(node, ast.ImportFrom) and node.module and 'django' in node.module:
                 for alias in node.names:
                     imports.add(alias.name)
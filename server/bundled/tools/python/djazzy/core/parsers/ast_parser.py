@@ -1,37 +1,154 @@
 import ast
+import re
+import sys
 import keyword
 import builtins
 import tokenize
 
 from io import StringIO
-from typing import Dict, Any
+
+from collections import namedtuple
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Sequence, Tuple
 
 from djazzy.core.diagnostics import Diagnostic
+from djazzy.core.lib.ast_cache import parse_source
 from djazzy.core.lib.issue import IssueSeverity
+from djazzy.core.lib.source_index import SourceIndex, get_source_index
 from djazzy.core.checks.name_validator.checker import NameValidator
 from djazzy.core.checks.enforce_test_name_convention.checker import TestNamingCheckService
 from djazzy.core.lib.settings import DjangolySettings, set_settings
 
-from ..lib.constants import DJANGO_IGNORE_FUNCTIONS
+from ..lib.constants import DJANGO_IGNORE_FUNCTIONS, EMPTY_FUNCTION_DEFINITION_LENGTH
 from ..lib.log import LOGGER
 
+COMMENT_TYPE = 'comment'
+
+# Comments are kept as light tuples and only turned into dicts for the diagnostics that report them
+Comment = namedtuple('Comment', ['type', 'value', 'line', 'col_offset', 'end_col_offset'])
+
+# Body lines, raw body, decorator sources and arguments of a function definition
+FunctionContext = Tuple[List[Dict[str, Any]], str, List[Optional[str]], List[Dict[str, Any]]]
+
+# Same names hasattr(builtins, name) accepts: module attributes plus the ones inherited from the
+# module type, such as __init__ and __repr__
+PYTHON_RESERVED_NAMES = (
+    frozenset(keyword.kwlist) | frozenset(dir(builtins)) | frozenset(dir(type(builtins)))
+)
+# Function names that are never reported on, checked with a single membership test
+RESERVED_FUNCTION_NAMES = DJANGO_IGNORE_FUNCTIONS | PYTHON_RESERVED_NAMES
+
+# String literals are matched so that a '#' inside one is never taken for a comment
+STRING_OR_COMMENT_PATTERN = re.compile(
+    r'"""(?:[^"\\]|\\.|"(?!""))*"""'
+    r"|'''(?:[^'\\]|\\.|'(?!''))*'''"
+    r'|"(?:[^"\\\n]|\\(?:\r\n|.))*"'
+    r"|'(?:[^'\\\n]|\\(?:\r\n|.))*'"
+    r'|(?P<comment>#[^\r\n]*)',
+    re.DOTALL,
+)
+# Since Python 3.12 (PEP 701) an f-string can reuse its own quote inside a replacement field,
+# e.g. f"{d["#"]}", which the pattern above cannot scan, so those sources go through tokenize
+NESTED_F_STRING_QUOTES = sys.version_info >= (3, 12)
+F_STRING_PREFIX_PATTERN = re.compile(r'(?<!\w)(?:[fF][rR]?|[rR][fF])[\'"]')
+
+# Nodes that never contain anything the analyzer reports on, so their subtrees are not walked
+LEAF_NODE_TYPES = frozenset(
+    [ast.Name, ast.Constant, ast.alias, ast.Import, ast.ImportFrom, ast.Pass, ast.Break, ast.Continue, ast.Global, ast.Nonlocal]
+    + [
+        node_type
+        for base_type in (ast.expr_context, ast.operator, ast.boolop, ast.unaryop, ast.cmpop)
+        for node_type in base_type.__subclasses__()
+    ]
+)
+
+# Fields that only ever hold identifiers, strings, numbers or flags, never child nodes
+SCALAR_FIELD_NAMES = frozenset(['name', 'id', 'attr', 'arg', 'asname', 'module', 'level', 'kind', 'type_comment', 'simple', 'is_async', 'conversion', 'tag'])
+
+
+def _get_node_types(base_type: type) -> List[type]:
+    node_types = [base_type]
+    for subclass in base_type.__subclasses__():
+        node_types.extend(_get_node_types(subclass))
+    return node_types
+
+
+# The fields of each node type that can hold child nodes, classified once at import
+CHILD_FIELDS_BY_TYPE: Dict[type, Tuple[str, ...]] = {
+    node_type: tuple(field for field in node_type._fields if field not in SCALAR_FIELD_NAMES)
+    for node_type in _get_node_types(ast.AST)
+}
+
+
+@lru_cache(maxsize=None)
+def get_visitor_method_names(visitor_class: type) -> Dict[type, str]:
+    """Find the visit_* handlers a visitor class defines for AST node types, scanning each class only once."""
+    method_names = {}
+    for attribute_name in dir(visitor_class):
+        if not attribute_name.startswith('visit_') or hasattr(ast.NodeVisitor, attribute_name):
+            continue
+        node_type = getattr(ast, attribute_name[len('visit_'):], None)
+        if isinstance(node_type, type) and issubclass(node_type, ast.AST):
+            method_names[node_type] = attribute_name
+    return method_names
+
 
 class Analyzer(ast.NodeVisitor):
     def __init__(self, current_file_path: str, source_code: str, settings: Dict[str, Any] = {}):
         self.settings = self.load_default_settings(settings)
         LOGGER.debug(f"Loaded settings: {self.settings}")
-        self.current_file_path = current_file_path
-        self.source_code = source_code
-        self.tree = None
-        self.diagnostics = []
-        self.comments = []
-        self.pending_comments = []
-        self.url_patterns = []
-        self.current_class_type = None
-        self.in_class = False
+        self.current_file_path: str = current_file_path
+        self.source_code: str = source_code
+        self.source_index: SourceIndex = get_source_index(source_code)
+        self.tree: Optional[ast.Module] = None
+        self.diagnostics: List[Diagnostic] = []
+        self.comments: List[Comment] = []
+        self.comments_by_line: Dict[int, List[Comment]] = {}
+        self.url_patterns: List[Any] = []
+        self.current_class_type: Optional[str] = None
+        self.in_class: bool = False
+        self.current_assign_name: Optional[str] = None
+        self.function_contexts: Dict[ast.FunctionDef, FunctionContext] = {}
 
         self.name_validator = NameValidator()
         self.test_name_checker = TestNamingCheckService()
+        self.visitor_dispatch: Dict[type, Callable[[ast.AST], Any]] = self._build_visitor_dispatch()
+        self.skipped_node_types: FrozenSet[type] = LEAF_NODE_TYPES.difference(self.visitor_dispatch)
+
+    def _build_visitor_dispatch(self) -> Dict[type, Callable[[ast.AST], Any]]:
+        """
+        Map AST node types to their bound visit_* handlers once, so visit() does a single
+        dict lookup instead of NodeVisitor's per-node name formatting and getattr.
+        """
+        return {
+            node_type: getattr(self, method_name)
+            for node_type, method_name in get_visitor_method_names(type(self)).items()
+        }
+
+    def visit(self, node: ast.AST) -> Any:
+        visitor = self.visitor_dispatch.get(type(node))
+        if visitor is None:
+            return self.generic_visit(node)
+        return visitor(node)
+
+    def generic_visit(self, node: ast.AST) -> None:
+        # Children are dispatched here directly rather than through visit(), saving a call per node
+        skipped_node_types = self.skipped_node_types
+        get_visitor = self.visitor_dispatch.get
+        generic_visit = self.generic_visit
+        child_fields = CHILD_FIELDS_BY_TYPE.get(type(node))
+        for field in node._fields if child_fields is None else child_fields:
+            value = getattr(node, field, None)
+            if isinstance(value, list):
+                for item in value:
+                    if isinstance(item, ast.AST):
+                        item_type = type(item)
+                        if item_type not in skipped_node_types:
+                            get_visitor(item_type, generic_visit)(item)
+            elif isinstance(value, ast.AST):
+                value_type = type(value)
+                if value_type not in skipped_node_types:
+                    get_visitor(value_type, generic_visit)(value)
 
     def load_default_settings(self, project_settings: Dict[str, Any] = {}) -> Dict[str, Any]:
         current_settings = DjangolySettings(project_settings)
@@ -49,90 +166,99 @@ class Analyzer(ast.NodeVisitor):
     def get_settings(self) -> Dict[str, Any]:
         return self.settings
 
-    def is_python_reserved(self, name: str) -> bool:
-        return keyword.iskeyword(name) or hasattr(builtins, name)
-
-    def get_comments(self):
-        tokens = tokenize.generate_tokens(StringIO(self.source_code).readline)
-        previous_line = 0
-        for token_number, token_value, start, end, _ in tokens:
-            if token_number == tokenize.COMMENT:
-                if start[0] - 1 == previous_line:
-                    self.pending_comments.append({
-                        'type': 'comment',
-                        'value': token_value.strip('#').strip(),
-                        'line': start[0] - 1,
-                        'col_offset': start[1],
-                        'end_col_offset': end[1]
-                    })
-                else:
-                    self.comments.extend(self.pending_comments)
-                    self.pending_comments = [{
-                        'type': 'comment',
-                        'value': token_value.strip('#').strip(),
-                        'line': start[0] - 1,
-                        'col_offset': start[1],
-                        'end_col_offset': end[1]
-                    }]
-                previous_line = start[0]
-            else:
-                previous_line = end[0]
-        self.comments.extend(self.pending_comments)
-
-    def get_related_comments(self, node):
-        related_comments = []
-        for comment in self.comments:
-            if comment['line'] == node.lineno - 2:
-                related_comments.append(comment)
-        return related_comments
-    
-    def add_diagnostic(self, **kwargs):
-        if 'full_line_length' not in kwargs or kwargs['full_line_length'] is None:
-            kwargs['full_line_length'] = len(self.source_code.splitlines()[kwargs['line'] - 1])
+    def get_source_segment(self, node: ast.AST) -> Optional[str]:
+        return self.source_index.get_source_segment(node)
+
+    def get_comments(self) -> None:
+        # Both structures are rebuilt together so a repeated call never duplicates comments
+        comments = self.comments = []
+        comments_by_line = self.comments_by_line = {}
+        if '#' not in self.source_code:
+            # No comments are possible, so skip the scan entirely.
+            return
 
+        if NESTED_F_STRING_QUOTES and F_STRING_PREFIX_PATTERN.search(self.source_code):
+            comment_positions = self.tokenize_comments()
+        else:
+            comment_positions = self.scan_comments()
+
+        for line_number, col_offset, comment_text in comment_positions:
+            comment = Comment(
+                COMMENT_TYPE,
+                comment_text.strip('#').strip(),
+                line_number,
+                col_offset,
+                col_offset + len(comment_text),
+            )
+            comments.append(comment)
+            comments_by_line.setdefault(line_number, []).append(comment)
+
+    def scan_comments(self) -> Iterator[Tuple[int, int, str]]:
+        """Yield the 0-based line, column and text of each comment, skipping '#' inside string literals."""
+        source_code = self.source_code
+        line_number = 0
+        scanned_up_to = 0
+        for match in STRING_OR_COMMENT_PATTERN.finditer(source_code):
+            comment_text = match.group('comment')
+            if comment_text is None:
+                continue
+            start = match.start()
+            line_number += source_code.count('\n', scanned_up_to, start)
+            scanned_up_to = start
+            yield line_number, start - source_code.rfind('\n', 0, start) - 1, comment_text
+
+    def tokenize_comments(self) -> Iterator[Tuple[int, int, str]]:
+        """Same as scan_comments, using the tokenizer for sources the pattern cannot scan."""
+        for token in tokenize.generate_tokens(StringIO(self.source_code).readline):
+            if token.type == tokenize.COMMENT:
+                yield token.start[0] - 1, token.start[1], token.string
+
+    def get_related_comments(self, node: ast.AST) -> Sequence[Comment]:
+        return self.comments_by_line.get(node.lineno - 2, ())
+    
+    def add_diagnostic(self, **kwargs: Any) -> None:
+        line = kwargs.pop('line', None)
+        full_line_length = kwargs.pop('full_line_length', None)
+        if full_line_length is None:
+            full_line_length = len(self.source_index.lines[line - 1])
+
+        # TODO: think of a better way to handle skipping comments
+        if not self.settings['comments']['flagRedundant']:
+            kwargs.pop('comments', None)
+        elif 'comments' in kwargs:
+            kwargs['comments'] = [comment._asdict() for comment in kwargs['comments']]
+
+        # Core fields are popped off, so whatever remains in kwargs becomes the extra fields as-is
         diagnostic = Diagnostic(
             file_path=self.current_file_path,
-            line=kwargs.get("line"),
-            col_offset=kwargs.get("col_offset"),
-            end_col_offset=kwargs.get("end_col_offset"),
-            severity=kwargs.get("severity", IssueSeverity.INFORMATION),
-            message=kwargs.get("message", ''),
-            issue_code=kwargs.get("issue_code", ''),
-            full_line_length=kwargs.get("full_line_length"),
+            line=line,
+            col_offset=kwargs.pop("col_offset", None),
+            end_col_offset=kwargs.pop("end_col_offset", None),
+            severity=kwargs.pop("severity", IssueSeverity.INFORMATION),
+            message=kwargs.pop("message", ''),
+            issue_code=kwargs.pop("issue_code", ''),
+            full_line_length=full_line_length,
+            extra_fields=kwargs,
         )
-
-        for key, value in kwargs.items():
-            # TODO: think of a better way to handle skipping comments
-            if key == 'comments' and not self.settings['comments']['flagRedundant']:
-                continue
-
-            if not hasattr(diagnostic, key):
-                setattr(diagnostic, key, value)
-
         self.diagnostics.append(diagnostic)
 
-    def visit_FunctionDef(self, node):
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
         comments = self.get_related_comments(node)
-        is_reserved = DJANGO_IGNORE_FUNCTIONS.get(node.name, False) or self.is_python_reserved(node.name)
+        is_reserved = node.name in RESERVED_FUNCTION_NAMES
         if is_reserved:
             return
         
         function_start_line = node.lineno
         function_start_col = node.col_offset
         
-        function_end_line = node.body[-1].end_lineno if hasattr(node.body[-1], 'end_lineno') else node.body[-1].lineno
-        function_end_col = node.body[-1].end_col_offset if hasattr(node.body[-1], 'end_col_offset') else len(
-            self.source_code.splitlines()[function_end_line - 1]
-        )
+        function_end_line = node.body[-1].end_lineno
+        function_end_col = node.body[-1].end_col_offset
         
         if not node.body:
             function_end_line = function_start_line
-            function_end_col = function_start_col + len('def ' + node.name + '():')
+            function_end_col = function_start_col + EMPTY_FUNCTION_DEFINITION_LENGTH + len(node.name)
 
-        body_with_lines, body = self.get_function_body(node)
-        decorators = [ast.get_source_segment(self.source_code, decorator) for decorator in node.decorator_list]
         calls = []
-        arguments = self.extract_arguments(node.args)
 
         function_name_issue = self.name_validator.validate_function_name(
             function_name=node.name,
@@ -142,6 +268,7 @@ class Analyzer(ast.NodeVisitor):
         )
 
         if function_name_issue:
+            body_with_lines, body, decorators, arguments = self.get_function_context(node)
             self.add_diagnostic(
                 name=node.name,
                 message=function_name_issue.message,
@@ -177,85 +304,76 @@ class Analyzer(ast.NodeVisitor):
         
         self.generic_visit(node)
 
-    def get_function_body(self, node):
-        source_lines = self.source_code.splitlines()
+    def get_function_context(self, node: ast.FunctionDef) -> FunctionContext:
+        """
+        Return the body lines, raw body, decorator sources and arguments of a function.
+        Computed once per node, since both the Django and base visitors report on them.
+        """
+        context = self.function_contexts.get(node)
+        if context is None:
+            body_with_lines, body = self.get_function_body(node)
+            decorators = [self.get_source_segment(decorator) for decorator in node.decorator_list]
+            context = (body_with_lines, body, decorators, self.extract_arguments(node.args))
+            self.function_contexts[node] = context
+        return context
+
+    def get_function_body(self, node: ast.FunctionDef) -> Tuple[List[Dict[str, Any]], str]:
         if not node.body:
             return [], ""
         
         start_line = node.body[0].lineno - 1
-        end_line = (node.body[-1].end_lineno if hasattr(node.body[-1], 'end_lineno') else node.body[-1].lineno) - 1
+        end_line = node.body[-1].end_lineno - 1
         
-        body_with_lines = []
-        raw_body_lines = []
-        
-        for line_index, line in enumerate(source_lines[start_line:end_line + 1], start=start_line + 1):
-            if line_index == start_line + 1:
-                first_node = node.body[0]
-                start_col = first_node.col_offset
-            else:
-                start_col = len(line) - len(line.lstrip())
-            
-            if line_index == end_line + 1:
-                end_col = (node.body[-1].end_col_offset 
-                        if hasattr(node.body[-1], 'end_col_offset') 
-                        else len(line.rstrip()))
-            else:
-                end_col = len(line.rstrip())
-            
-            body_with_lines.append({
+        body_lines = self.source_index.lines[start_line:end_line + 1]
+        body_with_lines = [
+            {
                 'relative_line_number': line_index - start_line,
                 'absolute_line_number': line_index,
-                'start_col': start_col,
-                'end_col': end_col,
+                'start_col': len(line) - len(line.lstrip()),
+                'end_col': len(line.rstrip()),
                 'content': line,
-            })
-            raw_body_lines.append(line)
+            }
+            for line_index, line in enumerate(body_lines, start=start_line + 1)
+        ]
+        # The first and last lines are bounded by the body statements themselves, not by whitespace
+        body_with_lines[0]['start_col'] = node.body[0].col_offset
+        body_with_lines[-1]['end_col'] = node.body[-1].end_col_offset
         
-        raw_body = '\n'.join(raw_body_lines)
+        raw_body = '\n'.join(body_lines)
         
         return body_with_lines, raw_body
     
 
-    def extract_arguments(self, args_node):
-        arguments = []
+    def extract_arguments(self, args_node: ast.arguments) -> List[Dict[str, Any]]:
+        positional_args = args_node.args
         defaults = args_node.defaults
-        num_non_default_args = len(args_node.args) - len(defaults)
-
-        for index, arg in enumerate(args_node.args):
-            default_value = None
-            if index >= num_non_default_args:
-                default_value_node = defaults[index - num_non_default_args]
-                default_value = ast.get_source_segment(self.source_code, default_value_node)
-            arg_info = {
-                'name': arg.arg,
-                'line': arg.lineno,
-                'col_offset': arg.col_offset,
-                'default': default_value
-            }
-            arguments.append(arg_info)
-
-        if args_node.vararg:
-            arguments.append({
-                'name': args_node.vararg.arg,
-                'line': args_node.vararg.lineno,
-                'col_offset': args_node.vararg.col_offset,
-                'default': None
-            })
-        if args_node.kwarg:
-            arguments.append({
-                'name': args_node.kwarg.arg,
-                'line': args_node.kwarg.lineno,
-                'col_offset': args_node.kwarg.col_offset,
-                'default': None
-            })
+        # Defaults belong to the trailing arguments, so the leading ones are paired with None
+        default_nodes = [None] * (len(positional_args) - len(defaults)) + defaults
+        arguments = [
+            self.get_argument_info(arg, default_node)
+            for arg, default_node in zip(positional_args, default_nodes)
+        ]
+
+        for variadic_arg in (args_node.vararg, args_node.kwarg):
+            if variadic_arg:
+                arguments.append(self.get_argument_info(variadic_arg))
 
         return arguments
 
-    def visit_Assign(self, node):
-        for target in node.targets:
-            if isinstance(target, ast.Name):
-                value_source = ast.get_source_segment(self.source_code, node.value)
-                comments = self.get_related_comments(node)
+    def get_argument_info(self, arg: ast.arg, default_node: Optional[ast.expr] = None) -> Dict[str, Any]:
+        return {
+            'name': arg.arg,
+            'line': arg.lineno,
+            'col_offset': arg.col_offset,
+            'default': self.get_source_segment(default_node) if default_node is not None else None
+        }
+
+    def visit_Assign(self, node: ast.Assign) -> None:
+        name_targets = [target for target in node.targets if isinstance(target, ast.Name)]
+        if name_targets:
+            value_source = self.get_source_segment(node.value)
+            comments = self.get_related_comments(node)
+            for target in name_targets:
                 variable_issue = self.name_validator.validate_variable_name(
                     variable_name=target.id,
                     variable_value=value_source,
@@ -277,40 +395,44 @@ class Analyzer(ast.NodeVisitor):
                         value=value_source
                     )
 
+        # Dicts anywhere under this assignment are reported against its first name target
+        enclosing_assign_name = self.current_assign_name
+        self.current_assign_name = name_targets[0].id if name_targets else None
         self.generic_visit(node)
-
-    def visit_Dict(self, node):
-        comments = self.get_related_comments(node)
-        for parent in ast.walk(self.tree):
-            if isinstance(parent, ast.Assign) and node in ast.walk(parent):
-                targets = [t.id for t in parent.targets if isinstance(t, ast.Name)]
-                if targets:
-                    name = targets[0]
-
-                    # Validate dictionary keys
-                    for key, value in zip(node.keys, node.values):
-                        if isinstance(key, ast.Constant):
-                            dictionary_issue = self.name_validator.validate_object_property_name(
-                                object_key=str(key.value),
-                                object_value=ast.get_source_segment(self.source_code, value),
-                                lineno=key.lineno,
-                                col=key.col_offset
-                            )
-                            if dictionary_issue:
-                                self.add_diagnostic(
-                                    name=name,
-                                    severity=dictionary_issue.severity,
-                                    comments=comments,
-                                    message=dictionary_issue.message,
-                                    line=dictionary_issue.lineno,
-                                    col_offset=dictionary_issue.col,
-                                    end_col_offset=node.end_col_offset if hasattr(node, 'end_col_offset') else None,
-                                    issue_code=dictionary_issue.code,
-                                    value=ast.get_source_segment(self.source_code, node)
-                                )
+        self.current_assign_name = enclosing_assign_name
+
+    def visit_Dict(self, node: ast.Dict) -> None:
+        name = self.current_assign_name
+        if name is not None:
+            comments = self.get_related_comments(node)
+            dict_source = None
+
+            # Validate dictionary keys
+            for key, value in zip(node.keys, node.values):
+                if isinstance(key, ast.Constant):
+                    dictionary_issue = self.name_validator.validate_object_property_name(
+                        object_key=str(key.value),
+                        object_value=self.get_source_segment(value),
+                        lineno=key.lineno,
+                        col=key.col_offset
+                    )
+                    if dictionary_issue:
+                        if dict_source is None:
+                            dict_source = self.get_source_segment(node)
+                        self.add_diagnostic(
+                            name=name,
+                            severity=dictionary_issue.severity,
+                            comments=comments,
+                            message=dictionary_issue.message,
+                            line=dictionary_issue.lineno,
+                            col_offset=dictionary_issue.col,
+                            end_col_offset=node.end_col_offset,
+                            issue_code=dictionary_issue.code,
+                            value=dict_source
+                        )
         self.generic_visit(node)
 
-    def visit_For(self, node):
+    def visit_For(self, node: ast.For) -> None:
         comments = self.get_related_comments(node)
         target_positions = []
 
@@ -327,6 +449,7 @@ class Analyzer(ast.NodeVisitor):
 
         target_positions.extend(add_target_positions(node.target))
 
+        loop_source = None
         # Validate the for loop target variable names
         for variable_name, line, col in target_positions:
             variable_issue = self.name_validator.validate_variable_name(
@@ -337,6 +460,8 @@ class Analyzer(ast.NodeVisitor):
             )
 
             if variable_issue:
+                if loop_source is None:
+                    loop_source = self.get_source_segment(node)
                 self.add_diagnostic(
                     name=None,
                     severity=variable_issue.severity,
@@ -345,9 +470,9 @@ class Analyzer(ast.NodeVisitor):
                     comments=comments,
                     line=variable_issue.lineno,
                     col_offset=variable_issue.col,
-                    end_col_offset=node.end_col_offset if hasattr(node, 'end_col_offset') else None,
+                    end_col_offset=node.end_col_offset,
                     is_reserved=False,
-                    body=ast.get_source_segment(self.source_code, node),
+                    body=loop_source,
                     target_positions=target_positions
                 )
         self.generic_visit(node)
@@ -356,7 +481,7 @@ class Analyzer(ast.NodeVisitor):
         LOGGER.debug("Running parser...")
         try:
             self.get_comments()
-            self.tree = ast.parse(self.source_code)
+            self.tree = parse_source(self.source_code)
             self.visit(self.tree)
             LOGGER.debug(f"Parsing complete. Found {len(self.diagnostics)} diagnostics.")
         except (SyntaxError, IndentationError) as e:
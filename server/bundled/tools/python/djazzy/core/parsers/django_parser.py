@@ -2,8 +2,9 @@ import ast
 import json
 from typing import Optional, Dict, Any
 from ..lib.log import LOGGER
-from ..lib.constants import DJANGO_IGNORE_FUNCTIONS
-from .ast_parser import Analyzer
+from ..lib.ast_cache import parse_source
+from ..lib.ast_walk import walk_statements
+from .ast_parser import Analyzer, RESERVED_FUNCTION_NAMES
 from ..checks.security.checker import SecurityCheckService
 from ..checks.model_fields.checker import ModelFieldCheckService
 from ..checks.skinny_views.checker import ViewComplexityAnalyzer
@@ -56,12 +57,12 @@ class DjangoAnalyzer(Analyzer):
 
     def get_class_definitions(self):
         LOGGER.debug("Collecting Django class definitions...")
-        for node in ast.walk(self.tree):
+        for node in walk_statements(self.tree):
             if isinstance(node, ast.ClassDef):
                 self.class_definitions[node.name] = node
         LOGGER.debug(f"Collected {len(self.class_definitions)} class definitions.")
 
-    def check_function_node_for_issues(self, node, symbol_type, body, body_with_lines, function_start_line, function_end_line, function_start_col, function_end_col, decorators, calls, arguments):
+    def check_function_node_for_issues(self, node, symbol_type, function_start_line, function_end_line, function_start_col, function_end_col, calls):
         message, severity, issue_code = None, None, None
 
         if symbol_type == DjangoViewType.FUNCTIONAL_VIEW or symbol_type == f'{DjangoViewType.CLASS_VIEW}_method':
@@ -78,7 +79,8 @@ class DjangoAnalyzer(Analyzer):
 
             exception_handling_issue = self.exception_handler_service.run_check(node)
             if exception_handling_issue:
-                full_line_text = self.source_code.splitlines()[node.lineno - 1]
+                body_with_lines, body, decorators, arguments = self.get_function_context(node)
+                full_line_text = self.source_index.lines[node.lineno - 1]
                 full_line_length = len(full_line_text)
                 self.add_diagnostic(
                     name=node.name,
@@ -103,7 +105,8 @@ class DjangoAnalyzer(Analyzer):
         return message, severity, issue_code
     
     def visit_Call(self, node):
-        self.security_service.visit_Call(node)
+        # The analyzer already walks every node, so the security service only inspects this one.
+        self.security_service.check_call(node)
         self.generic_visit(node)
 
     def visit_ClassDef(self, node):
@@ -136,21 +139,8 @@ class DjangoAnalyzer(Analyzer):
         self.current_django_class_type = None
 
     def visit_FunctionDef(self, node):
-        security_issues = self.security_service.check_raw_sql(node)
-        if security_issues:
-            for issue in security_issues:
-                self.add_diagnostic(
-                    name=ast.dump(node.func),
-                    line=issue.lineno,
-                    col_offset=issue.col_offset,
-                    end_col_offset=issue.end_col_offset,
-                    severity=issue.severity,
-                    message=issue.message,
-                    issue_code=issue.code
-                )
-
         comments = self.get_related_comments(node)
-        is_reserved = DJANGO_IGNORE_FUNCTIONS.get(node.name, False) or self.is_python_reserved(node.name)
+        is_reserved = node.name in RESERVED_FUNCTION_NAMES
         if is_reserved:
             LOGGER.debug(f"Ignoring reserved function {node.name}")
             return
@@ -160,10 +150,7 @@ class DjangoAnalyzer(Analyzer):
         if not node.body:
             function_end_line, function_end_col = self.function_node_service.get_empty_function_position(function_start_line, function_start_col, node.name)
 
-        body_with_lines, body = self.get_function_body(node)
-        decorators = [ast.get_source_segment(self.source_code, decorator) for decorator in node.decorator_list]
         calls = []
-        arguments = self.extract_arguments(node.args)
 
         redundant_query_issue = self.redundant_queryset_check_service.run_check(node)
         if redundant_query_issue:
@@ -183,18 +170,16 @@ class DjangoAnalyzer(Analyzer):
         message, severity, issue_code = self.check_function_node_for_issues(
             node,
             symbol_type,
-            body,
-            body_with_lines,
             function_start_line,
             function_end_line,
             function_start_col,
             function_end_col,
-            decorators,
             calls,
-            arguments,
         )
 
         if message and issue_code:
+            # Body, decorator and argument sources are only needed once there is something to report
+            body_with_lines, body, decorators, arguments = self.get_function_context(node)
             self.add_diagnostic(
                 name=node.name,
                 message=message,
@@ -218,27 +203,27 @@ class DjangoAnalyzer(Analyzer):
         super().visit_FunctionDef(node)
 
     def visit_Assign(self, node):
-        for target in node.targets:
-            if isinstance(target, ast.Name):
-                self.security_service.visit_Assign(node)
+        self.security_service.check_assign(node)
 
-                value_source = ast.get_source_segment(self.source_code, node.value)
-                comments = self.get_related_comments(node)
+        name_targets = [target for target in node.targets if isinstance(target, ast.Name)]
+        field_issues = self.model_field_check_service.run_model_field_checks(node) if name_targets else None
+        if field_issues:
+            value_source = self.get_source_segment(node.value)
+            comments = self.get_related_comments(node)
 
-                field_issues = self.model_field_check_service.run_model_field_checks(node)
-                if field_issues:
-                    for issue in field_issues:
-                        self.add_diagnostic(
-                            name=target.id,
-                            comments=comments,
-                            line=node.lineno,
-                            col_offset=node.col_offset,
-                            end_col_offset=node.col_offset + len(target.id),
-                            value=value_source,
-                            severity=issue.severity,
-                            message=issue.message,
-                            issue_code=issue.code,
-                        )
+            for target in name_targets:
+                for issue in field_issues:
+                    self.add_diagnostic(
+                        name=target.id,
+                        comments=comments,
+                        line=node.lineno,
+                        col_offset=node.col_offset,
+                        end_col_offset=node.col_offset + len(target.id),
+                        value=value_source,
+                        severity=issue.severity,
+                        message=issue.message,
+                        issue_code=issue.code,
+                    )
 
         super().visit_Assign(node)
 
@@ -248,7 +233,7 @@ class DjangoAnalyzer(Analyzer):
         try:
             LOGGER.debug("Parsing Django code")
             self.get_comments()
-            self.tree = ast.parse(self.source_code)
+            self.tree = parse_source(self.source_code)
             self.get_class_definitions()
 
             super().visit(self.tree)
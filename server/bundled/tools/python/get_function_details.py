@@ -1,16 +1,17 @@
 import ast
-import json
 import sys
 from typing import List, Optional, Dict
 
-from util import serialize_file_data
+from util import encode_json_line, read_source_from_stdin, write_stdout_bytes
 from log import LOGGER
 
+from djazzy.core.lib.ast_walk import walk_statements
 from djazzy.core.parsers.ast_parser import Analyzer
 
 
 def get_relevant_imports(tree: ast.Module, function_name: str) -> List[str]:
     relevant_imports = []
+    module_imports = None
     for node in ast.walk(tree):
         # Check if it's an Import or ImportFrom node
         if isinstance(node, (ast.Import, ast.ImportFrom)):
@@ -18,9 +19,15 @@ def get_relevant_imports(tree: ast.Module, function_name: str) -> List[str]:
         # Check if the import is used within the function's AST
         elif isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
             if node.func.id == function_name:
-                for ancestor in ast.walk(tree):
-                    if isinstance(ancestor, (ast.Import, ast.ImportFrom)) and ast.unparse(ancestor) not in relevant_imports:
-                        relevant_imports.append(ast.unparse(ancestor))
+                # Imports are statements, so they are collected once without descending into expressions
+                if module_imports is None:
+                    module_imports = [
+                        ast.unparse(statement) for statement in walk_statements(tree)
+                        if isinstance(statement, (ast.Import, ast.ImportFrom))
+                    ]
+                for import_source in module_imports:
+                    if import_source not in relevant_imports:
+                        relevant_imports.append(import_source)
     return relevant_imports
 
 
@@ -86,11 +93,11 @@ def main():
         LOGGER.error("Line number must be an integer.")
         sys.exit(1)
 
-    input_code = sys.stdin.read()
+    input_code = read_source_from_stdin()
     parsed_code = get_function_details(input_code, function_name, line_number)
     
     if parsed_code:
-        print(json.dumps(parsed_code, default=serialize_file_data))
+        write_stdout_bytes(encode_json_line(parsed_code))
     else:
         LOGGER.warning(f"Function '{function_name}' not found at line {line_number}.")
         sys.exit(1)
@@ -0,0 +1,117 @@
+"""
+Persistent cache of the JSON line run_check.py prints for a document.
+
+The cache is off unless the djazzy.general.cacheDiagnostics setting is enabled, because cached
+diagnostics contain source lines. Entries live in $XDG_CACHE_HOME/djazzy/diagnostics
+(~/.cache/djazzy/diagnostics by default), keyed on the interpreter, the loaded tool modules,
+the file path, the settings and the source. At most MAX_CACHED_RESULTS entries are kept.
+"""
+import hashlib
+import os
+import sys
+import tempfile
+import time
+from typing import Any, Dict, Optional
+
+from log import LOGGER
+from djazzy.core.lib.settings import ensure_dict
+
+MAX_CACHED_RESULTS = 256
+CACHE_FILE_SUFFIX = '.json'
+TEMPORARY_FILE_SUFFIX = '.tmp'
+# Temporary files older than this were left behind by a failed write rather than one in progress
+STALE_TEMPORARY_FILE_SECONDS = 60
+TOOLS_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+
+def is_cache_enabled(extension_settings: Dict[str, Any]) -> bool:
+    return ensure_dict(extension_settings.get('general')).get('cacheDiagnostics') is True
+
+
+def get_cache_directory() -> str:
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'djazzy', 'diagnostics')
+
+
+def get_tools_fingerprint() -> str:
+    """
+    Paths and modification times of the loaded tool modules, so results cached by an older
+    or locally edited version of the checks are never reused.
+    """
+    module_stamps = []
+    for module in list(sys.modules.values()):
+        module_file = getattr(module, '__file__', None)
+        if module_file and module_file.startswith(TOOLS_DIRECTORY + os.sep):
+            module_stamps.append(f"{module_file}:{os.stat(module_file).st_mtime_ns}")
+    return '|'.join(sorted(module_stamps))
+
+
+def get_cache_key(*parts: str) -> Optional[str]:
+    """
+    The interpreter version is part of the key because the grammar the parser accepts and the
+    positions it reports differ between Python versions. Returns None when no key can be
+    computed, in which case the result is neither read from nor written to the cache.
+    """
+    try:
+        digest = hashlib.sha1()
+        for part in (sys.version, get_tools_fingerprint(), *parts):
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+    except Exception as e:
+        LOGGER.debug(f"Unable to compute cache key: {e}")
+        return None
+
+
+def read_cached_result(cache_key: str) -> Optional[bytes]:
+    cache_path = os.path.join(get_cache_directory(), cache_key + CACHE_FILE_SUFFIX)
+    try:
+        with open(cache_path, 'rb') as cache_file:
+            cached_result = cache_file.read()
+        # Refresh the entry so trimming evicts the least recently used results first
+        os.utime(cache_path)
+        return cached_result
+    except OSError:
+        return None
+
+
+def write_cached_result(cache_key: str, result: bytes) -> None:
+    cache_directory = get_cache_directory()
+    temporary_path = None
+    try:
+        os.makedirs(cache_directory, exist_ok=True)
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=cache_directory, suffix=TEMPORARY_FILE_SUFFIX)
+        with os.fdopen(file_descriptor, 'wb') as cache_file:
+            cache_file.write(result)
+        os.replace(temporary_path, os.path.join(cache_directory, cache_key + CACHE_FILE_SUFFIX))
+        temporary_path = None
+        trim_cache(cache_directory)
+    except OSError as e:
+        LOGGER.debug(f"Unable to write cached result: {e}")
+    finally:
+        if temporary_path is not None:
+            remove_file(temporary_path)
+
+
+def trim_cache(cache_directory: str) -> None:
+    entries = []
+    stale_before = time.time() - STALE_TEMPORARY_FILE_SECONDS
+    for entry in os.scandir(cache_directory):
+        if entry.name.endswith(CACHE_FILE_SUFFIX):
+            entries.append(entry)
+        elif entry.name.endswith(TEMPORARY_FILE_SUFFIX) and entry.stat().st_mtime < stale_before:
+            remove_file(entry.path)
+
+    if len(entries) <= MAX_CACHED_RESULTS:
+        return
+
+    entries.sort(key=lambda entry: entry.stat().st_mtime)
+    for entry in entries[:len(entries) - MAX_CACHED_RESULTS]:
+        remove_file(entry.path)
+
+
+def remove_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
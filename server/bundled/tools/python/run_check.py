@@ -2,6 +2,8 @@ import sys
 import json
 
 from log import LOGGER
+from util import encode_json_line, read_source_from_stdin, write_stdout_bytes
+from results_cache import get_cache_key, is_cache_enabled, read_cached_result, write_cached_result
 from djazzy.core.parsers.django_parser import DjangoAnalyzer
 from djazzy.core.lib.settings import ensure_dict
 
@@ -12,13 +14,24 @@ def main():
 
     current_filepath = sys.argv[1]
     extension_settings_json = sys.argv[2]
-    extension_settings = json.loads(extension_settings_json)
-    input_code = sys.stdin.read()
+    extension_settings = ensure_dict(json.loads(extension_settings_json))
+    input_code = read_source_from_stdin()
+
+    # Identical documents checked with identical settings always produce the same diagnostics
+    cache_key = None
+    if is_cache_enabled(extension_settings):
+        cache_key = get_cache_key(current_filepath, extension_settings_json, input_code)
+    if cache_key is not None:
+        cached_output = read_cached_result(cache_key)
+        if cached_output is not None:
+            LOGGER.info(f"Using cached diagnostics for {current_filepath}")
+            write_stdout_bytes(cached_output)
+            return
 
     analyzer = DjangoAnalyzer(
         file_path=current_filepath,
         source_code=input_code,
-        settings=ensure_dict(extension_settings),
+        settings=extension_settings,
         model_cache_json=str({})
     )
     
@@ -29,7 +42,10 @@ def main():
     diagnostics_output = [diagnostic.to_dict() for diagnostic in result['diagnostics']]
     diagnostics_to_return = {"diagnostics": diagnostics_output, "diagnostics_count": result['diagnostics_count']}
 
-    print(json.dumps(diagnostics_to_return))
+    output = encode_json_line(diagnostics_to_return)
+    write_stdout_bytes(output)
+    if cache_key is not None:
+        write_cached_result(cache_key, output)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,84 @@
+import sys
+import tokenize
+import unittest
+from io import StringIO
+
+from djazzy.core.parsers.ast_parser import Analyzer
+
+
+def get_comments(source_code: str):
+    analyzer = Analyzer('file:///example.py', source_code, {})
+    analyzer.get_comments()
+    return [(comment.line, comment.col_offset, comment.value) for comment in analyzer.comments]
+
+
+def get_tokenized_comments(source_code: str):
+    return [
+        (token.start[0] - 1, token.start[1], token.string.strip('#').strip())
+        for token in tokenize.generate_tokens(StringIO(source_code).readline)
+        if token.type == tokenize.COMMENT
+    ]
+
+
+class CommentScannerTests(unittest.TestCase):
+    def assertMatchesTokenizer(self, source_code: str):
+        self.assertEqual(get_comments(source_code), get_tokenized_comments(source_code))
+
+    def test_hash_inside_strings_is_not_a_comment(self):
+        source_code = (
+            "url = 'https://example.com/#anchor'  # link\n"
+            'color = "#fff" + "\\"#"  # escaped quote\n'
+            "template = '''\n"
+            "# not a comment\n"
+            "'''  # after the docstring\n"
+        )
+        self.assertEqual(get_comments(source_code), [
+            (0, 37, 'link'),
+            (1, 24, 'escaped quote'),
+            (4, 5, 'after the docstring'),
+        ])
+        self.assertMatchesTokenizer(source_code)
+
+    def test_quotes_of_the_other_kind_inside_strings(self):
+        source_code = (
+            "message = \"it's # fine\"  # first\n"
+            "reply = 'say \"#1\"'  # second\n"
+            'block = """a "quoted" # value"""  # third\n'
+        )
+        self.assertEqual([comment[2] for comment in get_comments(source_code)], ['first', 'second', 'third'])
+        self.assertMatchesTokenizer(source_code)
+
+    def test_crlf_line_endings(self):
+        source_code = (
+            "# header\r\n"
+            "value = 'first \\\r\n"
+            "# still the string'  # after continuation\r\n"
+            "other = 1  # trailing\r\n"
+        )
+        self.assertEqual(get_comments(source_code), [
+            (0, 0, 'header'),
+            (2, 21, 'after continuation'),
+            (3, 11, 'trailing'),
+        ])
+        self.assertMatchesTokenizer(source_code)
+
+    def test_repeated_scans_do_not_duplicate_comments(self):
+        analyzer = Analyzer('file:///example.py', '# first\nvalue = 1  # second\n', {})
+        analyzer.get_comments()
+        analyzer.get_comments()
+
+        self.assertEqual([comment.value for comment in analyzer.comments], ['first', 'second'])
+        self.assertEqual(
+            {line: [comment.value for comment in comments] for line, comments in analyzer.comments_by_line.items()},
+            {0: ['first'], 1: ['second']},
+        )
+
+    @unittest.skipUnless(sys.version_info >= (3, 12), 'f-strings reuse their own quotes since Python 3.12')
+    def test_f_string_reusing_its_own_quotes(self):
+        source_code = 'x = f"{d["#"]}"  # real\n'
+        self.assertEqual(get_comments(source_code), [(0, 17, 'real')])
+        self.assertMatchesTokenizer(source_code)
+
+
+if __name__ == '__main__':
+    unittest.main()
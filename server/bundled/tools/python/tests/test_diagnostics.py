@@ -0,0 +1,56 @@
+import ast
+import unittest
+
+from djazzy.core.diagnostics import Diagnostic
+from djazzy.core.lib.source_index import SourceIndex
+
+
+def create_diagnostic(extra_fields=None):
+    return Diagnostic(
+        file_path='file:///example.py',
+        line=1,
+        col_offset=0,
+        end_col_offset=2,
+        severity='warning',
+        message='Function name is too short.',
+        issue_code='N001',
+        full_line_length=12,
+        extra_fields=extra_fields,
+    )
+
+
+class DiagnosticTests(unittest.TestCase):
+    def test_extra_fields_are_added_to_the_core_fields(self):
+        diagnostic_dict = create_diagnostic({'name': 'fs'}).to_dict()
+        self.assertEqual(diagnostic_dict['name'], 'fs')
+        self.assertEqual(diagnostic_dict['message'], 'Function name is too short.')
+
+    def test_extra_fields_cannot_replace_core_fields(self):
+        with self.assertRaises(ValueError):
+            create_diagnostic({'line': 10, 'name': 'fs'})
+
+
+class SourceIndexTests(unittest.TestCase):
+    def test_utf8_byte_columns_map_to_character_offsets(self):
+        source_code = "café = '€'; total = café + len('😀')\n"
+        index = SourceIndex(source_code)
+        assignment = ast.parse(source_code).body[1]
+
+        self.assertEqual(assignment.targets[0].col_offset, 15)
+        self.assertEqual(index.get_char_offset(1, assignment.targets[0].col_offset), 12)
+        self.assertEqual(index.get_source_segment(assignment.value), "café + len('😀')")
+
+    def test_segments_match_ast_for_non_ascii_sources(self):
+        source_code = (
+            "prix_é = {'clé': 'valeur é'}\r\n"
+            "def résumé(naïve='ü'):\r\n"
+            "    return f'{naïve} → {prix_é[\"clé\"]}'\r\n"
+        )
+        index = SourceIndex(source_code)
+        for node in ast.walk(ast.parse(source_code)):
+            if hasattr(node, 'end_col_offset'):
+                self.assertEqual(index.get_source_segment(node), ast.get_source_segment(source_code, node), ast.dump(node))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import builtins
+import keyword
+import textwrap
+import unittest
+
+from djazzy.core.lib.constants import DJANGO_IGNORE_FUNCTIONS
+from djazzy.core.parsers.ast_parser import Analyzer, RESERVED_FUNCTION_NAMES
+from djazzy.core.parsers.django_parser import DjangoAnalyzer
+
+SETTINGS = {'lint': {'select': ['ALL']}}
+
+
+def get_diagnostics(source_code: str, analyzer_class=DjangoAnalyzer):
+    analyzer = analyzer_class('file:///example.py', textwrap.dedent(source_code), SETTINGS)
+    return analyzer.parse_code()['diagnostics']
+
+
+class ReservedFunctionNameSetTests(unittest.TestCase):
+    def test_matches_keyword_builtins_and_django_checks(self):
+        candidate_names = (
+            set(dir(object)) | set(dir(type)) | set(dir(type(builtins))) | set(dir(dict))
+            | set(keyword.kwlist) | set(dir(builtins)) | DJANGO_IGNORE_FUNCTIONS
+            | {'__call__', '__getattr__', '__post_init__', 'fs', 'get_user', 'validate_email'}
+        )
+        for name in candidate_names:
+            expected = name in DJANGO_IGNORE_FUNCTIONS or keyword.iskeyword(name) or hasattr(builtins, name)
+            self.assertEqual(name in RESERVED_FUNCTION_NAMES, expected, name)
+
+
+class ReservedFunctionNameTests(unittest.TestCase):
+    def test_object_dunder_methods_are_not_reported(self):
+        source_code = """
+            class Point:
+                def __init__(self):
+                    fs = 1
+
+                def __repr__(self):
+                    return 'point'
+        """
+        self.assertEqual(get_diagnostics(source_code), [])
+
+    def test_object_dunder_methods_on_django_models_are_not_reported(self):
+        source_code = """
+            from django.db import models
+
+            class Point(models.Model):
+                def __init__(self):
+                    fs = 1
+
+                def __str__(self):
+                    return 'point'
+
+                def __hash__(self):
+                    return 1
+        """
+        self.assertEqual(get_diagnostics(source_code), [])
+
+    def test_both_analyzers_only_report_unreserved_functions(self):
+        source_code = """
+            class Point:
+                def __init__(self):
+                    fs = 1
+
+                def __repr__(self):
+                    return 'point'
+
+                def save(self):
+                    return None
+
+                def fs(self):
+                    return None
+        """
+        for analyzer_class in (Analyzer, DjangoAnalyzer):
+            with self.subTest(analyzer=analyzer_class.__name__):
+                messages = [diagnostic.message for diagnostic in get_diagnostics(source_code, analyzer_class)]
+                self.assertEqual(messages, ["Function name 'fs' is too short."])
+
+
+if __name__ == '__main__':
+    unittest.main()
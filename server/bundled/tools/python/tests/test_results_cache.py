@@ -0,0 +1,65 @@
+import os
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import results_cache
+
+
+class ResultsCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.cache_home = tempfile.TemporaryDirectory()
+        self.addCleanup(self.cache_home.cleanup)
+        environment = mock.patch.dict(os.environ, {'XDG_CACHE_HOME': self.cache_home.name})
+        environment.start()
+        self.addCleanup(environment.stop)
+        self.cache_directory = results_cache.get_cache_directory()
+
+    def test_cache_is_off_unless_enabled_in_settings(self):
+        self.assertFalse(results_cache.is_cache_enabled({}))
+        self.assertFalse(results_cache.is_cache_enabled({'general': {'cacheDiagnostics': False}}))
+        self.assertFalse(results_cache.is_cache_enabled({'general': None}))
+        self.assertTrue(results_cache.is_cache_enabled({'general': {'cacheDiagnostics': True}}))
+
+    def test_written_result_is_read_back(self):
+        results_cache.write_cached_result('key', b'{}\n')
+        self.assertEqual(results_cache.read_cached_result('key'), b'{}\n')
+
+    def test_cache_key_depends_on_the_interpreter(self):
+        cache_key = results_cache.get_cache_key('file.py', '{}', 'x = 1')
+        with mock.patch.object(sys, 'version', sys.version + ' (other build)'):
+            self.assertNotEqual(results_cache.get_cache_key('file.py', '{}', 'x = 1'), cache_key)
+
+    def test_cache_key_is_none_when_the_fingerprint_fails(self):
+        with mock.patch.object(results_cache.os, 'stat', side_effect=OSError('gone')):
+            self.assertIsNone(results_cache.get_cache_key('file.py', '{}', 'x = 1'))
+
+    def test_fingerprint_ignores_modules_in_sibling_directories(self):
+        sibling_module = mock.Mock(__file__=results_cache.TOOLS_DIRECTORY + '-other' + os.sep + 'module.py')
+        with mock.patch.dict(sys.modules, {'sibling_module': sibling_module}):
+            self.assertNotIn(sibling_module.__file__, results_cache.get_tools_fingerprint())
+
+    def test_failed_write_removes_its_temporary_file(self):
+        with mock.patch.object(results_cache.os, 'replace', side_effect=OSError('read-only')):
+            results_cache.write_cached_result('key', b'{}\n')
+        self.assertEqual(os.listdir(self.cache_directory), [])
+
+    def test_trim_removes_stale_temporary_files_only(self):
+        os.makedirs(self.cache_directory)
+        stale_path = os.path.join(self.cache_directory, 'stale' + results_cache.TEMPORARY_FILE_SUFFIX)
+        recent_path = os.path.join(self.cache_directory, 'recent' + results_cache.TEMPORARY_FILE_SUFFIX)
+        for path in (stale_path, recent_path):
+            with open(path, 'wb'):
+                pass
+        stale_time = time.time() - results_cache.STALE_TEMPORARY_FILE_SECONDS - 1
+        os.utime(stale_path, (stale_time, stale_time))
+
+        results_cache.trim_cache(self.cache_directory)
+        self.assertFalse(os.path.exists(stale_path))
+        self.assertTrue(os.path.exists(recent_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
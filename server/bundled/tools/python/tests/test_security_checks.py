@@ -0,0 +1,45 @@
+import unittest
+from unittest import mock
+
+from djazzy.core.checks.security.checker import SecurityCheckService
+from djazzy.core.parsers.django_parser import DjangoAnalyzer
+
+SETTINGS = {'lint': {'select': ['ALL']}}
+
+
+def get_security_issue_codes(source_code: str):
+    diagnostics = DjangoAnalyzer('file:///settings.py', source_code, SETTINGS).parse_code()['diagnostics']
+    return [diagnostic.issue_code for diagnostic in diagnostics if diagnostic.issue_code.startswith('SEC')]
+
+
+class SecurityTriggerTests(unittest.TestCase):
+    def test_settings_module_runs_the_checks(self):
+        source_code = "DEBUG = True\nSECRET_KEY = 'hardcoded'\nALLOWED_HOSTS = ['*']\n"
+        self.assertTrue(SecurityCheckService(source_code).has_security_triggers)
+        self.assertEqual(sorted(get_security_issue_codes(source_code)), ['SEC01', 'SEC02', 'SEC04'])
+
+    def test_raw_sql_call_runs_the_checks(self):
+        source_code = "books = Book.objects.raw('SELECT * FROM books')\n"
+        self.assertTrue(SecurityCheckService(source_code).has_security_triggers)
+        self.assertEqual(get_security_issue_codes(source_code), ['SEC13'])
+
+    def test_module_without_checked_names_is_skipped(self):
+        source_code = "debug_mode = True\nhosts = ['*']\n"
+        security_service = SecurityCheckService(source_code)
+        self.assertFalse(security_service.has_security_triggers)
+
+        with mock.patch.object(security_service, 'check_assignment_security') as check_assignment_security:
+            security_service.run_security_checks()
+        check_assignment_security.assert_not_called()
+        self.assertEqual(get_security_issue_codes(source_code), [])
+
+    def test_non_ascii_module_is_never_skipped(self):
+        # The parser NFKC-normalizes identifiers, so fullwidth ＤＥＢＵＧ is the DEBUG setting
+        source_code = "ＤＥＢＵＧ = True\n"
+        self.assertNotIn('DEBUG', source_code)
+        self.assertTrue(SecurityCheckService(source_code).has_security_triggers)
+        self.assertEqual(get_security_issue_codes(source_code), ['SEC01'])
+
+
+if __name__ == '__main__':
+    unittest.main()
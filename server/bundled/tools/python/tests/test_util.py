@@ -0,0 +1,22 @@
+import json
+import unittest
+
+from util import encode_json_line
+
+
+class EncodeJsonLineTests(unittest.TestCase):
+    def test_output_is_a_single_ascii_json_line(self):
+        data = {'message': "Variable 'café' costs 5€", 'line': 1}
+        output = encode_json_line(data)
+
+        self.assertTrue(output.isascii())
+        self.assertEqual(output.count(b'\n'), 1)
+        self.assertTrue(output.endswith(b'\n'))
+        self.assertEqual(json.loads(output), data)
+
+    def test_values_json_cannot_encode_are_converted_to_strings(self):
+        self.assertEqual(json.loads(encode_json_line({'severity': object})), {'severity': str(object)})
+
+
+if __name__ == '__main__':
+    unittest.main()
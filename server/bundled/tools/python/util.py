@@ -1,12 +1,23 @@
-import ast
-
-
-def serialize_file_data(obj):
-    if isinstance(obj, ast.AST):
-        return {k: serialize_file_data(v) for k, v in ast.iter_fields(obj)}
-    elif isinstance(obj, list):
-        return [serialize_file_data(i) for i in obj]
-    elif isinstance(obj, dict):
-        return {k: serialize_file_data(v) for k, v in obj.items()}
-    else:
-        return str(obj)
+import json
+import sys
+
+
+def read_source_from_stdin() -> str:
+    """
+    Read the document text from stdin in one shot and decode it as UTF-8, which is what the
+    extension writes, instead of going through the locale-dependent text wrapper.
+    """
+    return sys.stdin.buffer.read().decode('utf-8')
+
+
+def encode_json_line(data) -> bytes:
+    """
+    Serialize data as a single JSON line. Non-ASCII text stays escaped, so the extension can
+    decode stdout chunk by chunk without splitting a multi-byte character.
+    """
+    return (json.dumps(data, default=str, separators=(',', ':')) + '\n').encode('utf-8')
+
+
+def write_stdout_bytes(output: bytes) -> None:
+    sys.stdout.buffer.write(output)
+    sys.stdout.buffer.flush()
@@ -37,6 +37,7 @@ export interface ExtensionSettings {
 		nameLengthLimit: number;
 		functionLengthLimit: number;
 		ignoredFunctions: string[];
+		cacheDiagnostics: boolean;
 	};
 	comments: {
 		flagRedundant: boolean;
@@ -63,6 +64,7 @@ export const normalizeClientSettings = (
 		general: {
 			...defaultGeneralSettings,
 			booleanPrefixes: settings.general.booleanPrefixes,
+			cacheDiagnostics: settings.general.cacheDiagnostics === true,
 		},
 		comments: settings.comments,
 		lint: settings.lint,